@@ -15,13 +15,15 @@ from .agent_modelica_difficulty_layer_spec_v1 import (
 
 
 SCHEMA_VERSION = "agent_modelica_diagnostic_ir_v0"
-CANONICAL_ERROR_TYPES = {
-    "model_check_error",
-    "simulate_error",
-    "semantic_regression",
-    "numerical_instability",
-    "constraint_violation",
-}
+CANONICAL_ERROR_TYPES = frozenset(
+    {
+        "model_check_error",
+        "simulate_error",
+        "semantic_regression",
+        "numerical_instability",
+        "constraint_violation",
+    }
+)
 LEGACY_TO_CANONICAL = {
     "script_parse_error": "model_check_error",
 }
@@ -55,11 +55,11 @@ def _cleanup_omc_containers() -> None:
         if container_ids:
             subprocess.run(
                 ["docker", "stop", "--time", "5"] + container_ids,
-                capture_output=True, timeout=30,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30,
             )
             subprocess.run(
                 ["docker", "rm", "-f"] + container_ids,
-                capture_output=True, timeout=15,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15,
             )
     except Exception:
         pass
@@ -217,6 +217,10 @@ def prepare_workspace_model_layout(
 def run_cmd(cmd: list[str], timeout_sec: int, cwd: str | None = None) -> tuple[int | None, str]:
     """Run *cmd* as a subprocess; return (returncode, merged stdout+stderr).
 
+    Output is captured as bytes and decoded once as UTF-8 after merging;
+    undecodable bytes are replaced rather than failing the whole run, and
+    CRLF/CR line endings are normalized to LF as text mode would.
+
     Returns ``(None, "TimeoutExpired")`` on timeout and
     ``(None, "<ExcType>:<msg>")`` on other errors.
     """
@@ -224,12 +228,12 @@ def run_cmd(cmd: list[str], timeout_sec: int, cwd: str | None = None) -> tuple[i
         proc = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=max(1, int(timeout_sec)),
             check=False,
             cwd=cwd,
         )
-        merged = ((proc.stdout or "") + "\n" + (proc.stderr or "")).strip()
+        raw = (proc.stdout or b"") + b"\n" + (proc.stderr or b"")
+        merged = raw.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n").strip()
         return int(proc.returncode), merged
     except subprocess.TimeoutExpired:
         return None, "TimeoutExpired"
@@ -247,7 +251,7 @@ def run_omc_script_local(script_text: str, timeout_sec: int, cwd: str) -> tuple[
     _register_omc_cleanup_once()
     script_path = Path(cwd) / "run.mos"
     script_path.write_text(script_text, encoding="utf-8")
-    return run_cmd(["omc", str(script_path.name)], timeout_sec=timeout_sec, cwd=cwd)
+    return run_cmd(["omc", script_path.name], timeout_sec=timeout_sec, cwd=cwd)
 
 
 def run_omc_script_docker(
@@ -295,7 +299,7 @@ def run_omc_script_docker(
         "--user", uid_gid,
         "-e", "HOME=/workspace/.omc_home",
         "-v", f"{cwd}:/workspace",
-        "-v", f"{str(cache_root)}:/workspace/.omc_home/.openmodelica/libraries",
+        "-v", f"{cache_root}:/workspace/.omc_home/.openmodelica/libraries",
         "-w", "/workspace",
         image,
         "omc",
@@ -43,7 +43,7 @@ MAX_FILE_SLICE_LINE_CHARS = 240
 MAX_TOOL_READ_CHARS = 20_000
 TRUNCATED_READ_HEAD_CHARS = 12_000
 TRUNCATED_READ_TAIL_CHARS = 4_000
-LISTED_FILE_SUFFIXES = {".json", ".mo", ".txt", ".log"}
+LISTED_FILE_SUFFIXES = frozenset({".json", ".mo", ".txt", ".log"})
 
 
 class ProviderStepTimeout(Exception):
@@ -51,14 +51,14 @@ class ProviderStepTimeout(Exception):
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_bytes())
 
 
 def load_jsonl(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         return []
     rows: list[dict[str, Any]] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in path.read_bytes().splitlines():
         if not line.strip():
             continue
         row = json.loads(line)
@@ -90,7 +90,7 @@ def evaluate_optional_behavior(_task: dict[str, Any], _model_text: str) -> dict[
 def _write_case_status(case_workspace: Path, **fields: Any) -> None:
     status_path = case_workspace / "case_status.json"
     try:
-        current = json.loads(status_path.read_text(encoding="utf-8")) if status_path.exists() else {}
+        current = json.loads(status_path.read_bytes()) if status_path.exists() else {}
     except json.JSONDecodeError:
         current = {}
     current.update(fields)
@@ -103,7 +103,7 @@ def _read_case_status(case_workspace: Path) -> dict[str, Any]:
     if not status_path.exists():
         return {}
     try:
-        return json.loads(status_path.read_text(encoding="utf-8"))
+        return json.loads(status_path.read_bytes())
     except json.JSONDecodeError:
         return {"timeout_phase": "status_file_unreadable"}
 
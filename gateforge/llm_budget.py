@@ -41,7 +41,7 @@ def _load_json(path: Path) -> dict:
     if not path.exists():
         return {}
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = json.loads(path.read_bytes())
     except Exception:
         return {}
     return payload if isinstance(payload, dict) else {}
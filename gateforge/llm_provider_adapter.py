@@ -207,7 +207,7 @@ class GeminiProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "gemini_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -264,7 +264,7 @@ class GeminiProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return None, "gemini_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -334,7 +334,7 @@ class OpenAIProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "openai_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -377,7 +377,7 @@ class OpenAIProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return None, "openai_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -441,7 +441,7 @@ class QwenProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "qwen_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -518,7 +518,7 @@ class DeepSeekProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "deepseek_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -578,7 +578,7 @@ class DeepSeekProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return None, "deepseek_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -641,7 +641,7 @@ class AnthropicProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "anthropic_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -691,7 +691,7 @@ class AnthropicProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return None, "anthropic_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -753,7 +753,7 @@ class MiniMaxProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "minimax_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -818,7 +818,7 @@ class KimiProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "kimi_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -869,7 +869,7 @@ class KimiProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return None, "kimi_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -933,7 +933,7 @@ class GLMProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return "", "glm_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -984,7 +984,7 @@ class GLMProviderAdapter:
         )
         try:
             with urllib.request.urlopen(req, timeout=config.timeout_sec) as resp:
-                response_payload = json.loads(resp.read().decode("utf-8"))
+                response_payload = json.loads(resp.read())
         except TimeoutError:
             return None, "glm_request_timeout"
         except urllib.error.HTTPError as exc:
@@ -8,7 +8,7 @@ from typing import Any
 
 
 def load_jsonl(path: Path) -> list[dict[str, Any]]:
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [json.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
 
 
 def write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
@@ -109,13 +109,13 @@ def summarize_overlay(rows: list[dict[str, Any]], *, subject_key: str) -> dict[s
     }
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Build an adjusted evaluation table from replacement result rows.")
     parser.add_argument("--base-results", type=Path, required=True)
     parser.add_argument("--replacement-results", type=Path, action="append", default=[])
     parser.add_argument("--subject-key", default="subject_status")
     parser.add_argument("--out-dir", type=Path, required=True)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     base_rows = load_jsonl(args.base_results)
     replacements = load_replacements(list(args.replacement_results or []))
     adjusted_rows, summary = build_overlay(
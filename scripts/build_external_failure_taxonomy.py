@@ -8,7 +8,7 @@ from typing import Any
 
 
 def load_jsonl(path: Path) -> list[dict[str, Any]]:
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [json.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
 
 
 def _case_id(row: dict[str, Any]) -> str:
@@ -117,14 +117,14 @@ def build_taxonomy(
     return taxonomy_rows, summary
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Classify external-agent failure artifacts.")
     parser.add_argument("--pairwise-results", type=Path, required=True)
     parser.add_argument("--external-results", type=Path, required=True)
     parser.add_argument("--workspace-root", type=Path, required=True)
     parser.add_argument("--subject-key", default="subject_status")
     parser.add_argument("--out-dir", type=Path, required=True)
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     taxonomy_rows, summary = build_taxonomy(
         pairwise_rows=load_jsonl(args.pairwise_results),
         external_rows=load_jsonl(args.external_results),
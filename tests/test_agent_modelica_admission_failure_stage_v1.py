@@ -10,38 +10,22 @@ from gateforge.agent_modelica_admission_failure_stage_v1 import (
 
 class AgentModelicaAdmissionFailureStageV1Tests(unittest.TestCase):
     def test_classifies_coarse_run_stage(self) -> None:
-        self.assertEqual(
-            classify_admission_failure_stage(
-                check_ok=False,
-                simulate_ok=False,
-                output="Too few equations, under-determined system.",
-            ),
-            "model_check",
-        )
-        self.assertEqual(
-            classify_admission_failure_stage(
-                check_ok=True,
-                simulate_ok=False,
-                output="simulate failed",
-            ),
-            "simulate",
-        )
-        self.assertEqual(
-            classify_admission_failure_stage(
-                check_ok=True,
-                simulate_ok=True,
-                output="ok",
-            ),
-            "already_pass",
-        )
-        self.assertEqual(
-            classify_admission_failure_stage(
-                check_ok=False,
-                simulate_ok=False,
-                output="permission denied while trying to connect to the docker API",
-            ),
-            "environment_blocked",
-        )
+        cases = [
+            (False, False, "Too few equations, under-determined system.", "model_check"),
+            (True, False, "simulate failed", "simulate"),
+            (True, True, "ok", "already_pass"),
+            (False, False, "permission denied while trying to connect to the docker API", "environment_blocked"),
+        ]
+        for check_ok, simulate_ok, output, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertEqual(
+                    classify_admission_failure_stage(
+                        check_ok=check_ok,
+                        simulate_ok=simulate_ok,
+                        output=output,
+                    ),
+                    expected,
+                )
 
     def test_counts_stages(self) -> None:
         self.assertEqual(
@@ -7,9 +7,12 @@ excluded — they are exercised by the pre-existing Docker integration tests.
 from __future__ import annotations
 
 import os
+import shutil
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from gateforge.agent_modelica_omc_workspace_v1 import (
     WorkspaceModelLayout,
@@ -21,6 +24,7 @@ from gateforge.agent_modelica_omc_workspace_v1 import (
     norm_path_text,
     prepare_workspace_model_layout,
     rel_mos_path,
+    run_cmd,
     temporary_workspace,
 )
 
@@ -68,6 +72,41 @@ class TestRelMosPath(unittest.TestCase):
         self.assertEqual(result, "A/B.mo")
 
 
+# ---------------------------------------------------------------------------
+# run_cmd
+# ---------------------------------------------------------------------------
+
+
+class TestRunCmd(unittest.TestCase):
+    def test_merges_stdout_and_stderr(self):
+        completed = subprocess.CompletedProcess(["omc"], 0, stdout=b"Check ok\n", stderr=b"warning\n")
+        with patch("gateforge.agent_modelica_omc_workspace_v1.subprocess.run", return_value=completed):
+            rc, output = run_cmd(["omc"], timeout_sec=5)
+        self.assertEqual(rc, 0)
+        self.assertEqual(output, "Check ok\n\nwarning")
+
+    def test_undecodable_output_is_replaced(self):
+        completed = subprocess.CompletedProcess(["omc"], 1, stdout=b"caf\xe9 error", stderr=b"")
+        with patch("gateforge.agent_modelica_omc_workspace_v1.subprocess.run", return_value=completed):
+            rc, output = run_cmd(["omc"], timeout_sec=5)
+        self.assertEqual(rc, 1)
+        self.assertEqual(output, "caf\ufffd error")
+
+    def test_crlf_and_cr_line_endings_are_normalized(self):
+        completed = subprocess.CompletedProcess(["omc"], 0, stdout=b"a\r\nb\rc", stderr=b"warning\r\n")
+        with patch("gateforge.agent_modelica_omc_workspace_v1.subprocess.run", return_value=completed):
+            rc, output = run_cmd(["omc"], timeout_sec=5)
+        self.assertEqual(rc, 0)
+        self.assertEqual(output, "a\nb\nc\nwarning")
+
+    def test_timeout(self):
+        with patch(
+            "gateforge.agent_modelica_omc_workspace_v1.subprocess.run",
+            side_effect=subprocess.TimeoutExpired(["omc"], 5),
+        ):
+            self.assertEqual(run_cmd(["omc"], timeout_sec=5), (None, "TimeoutExpired"))
+
+
 # ---------------------------------------------------------------------------
 # extract_om_success_flags
 # ---------------------------------------------------------------------------
@@ -110,16 +149,21 @@ class TestExtractOmSuccessFlags(unittest.TestCase):
         self.assertFalse(check_ok)
         self.assertFalse(sim_ok)
 
-    def test_simulation_execution_failed(self):
-        output = self._check_flag_output() + 'record SimulationResult\n  resultFile = "r.mat",\nsimulation execution failed\nend SimulationResult;\n'
-        check_ok, sim_ok = extract_om_success_flags(output)
-        self.assertTrue(check_ok)
-        self.assertFalse(sim_ok)
-
-    def test_division_by_zero_fails_sim(self):
-        output = self._check_flag_output() + 'record SimulationResult\n  resultFile = "r.mat",\ndivision by zero\nend SimulationResult;\n'
-        _, sim_ok = extract_om_success_flags(output)
-        self.assertFalse(sim_ok)
+    def test_simulation_error_markers_fail_sim(self):
+        markers = (
+            "simulation execution failed",
+            "division by zero",
+            "integrator failed",
+        )
+        for marker in markers:
+            with self.subTest(marker=marker):
+                output = (
+                    self._check_flag_output()
+                    + f'record SimulationResult\n  resultFile = "r.mat",\n{marker}\nend SimulationResult;\n'
+                )
+                check_ok, sim_ok = extract_om_success_flags(output)
+                self.assertTrue(check_ok)
+                self.assertFalse(sim_ok)
 
     def test_structural_mismatch_fails_check(self):
         # 3 equations, 4 variables → not balanced
@@ -143,14 +187,6 @@ class TestExtractOmSuccessFlags(unittest.TestCase):
         check_ok, _ = extract_om_success_flags(output)
         self.assertTrue(check_ok)
 
-    def test_integrator_failed(self):
-        output = (
-            self._check_flag_output()
-            + 'record SimulationResult\n  resultFile = "r.mat",\nintegrator failed\nend SimulationResult;\n'
-        )
-        _, sim_ok = extract_om_success_flags(output)
-        self.assertFalse(sim_ok)
-
 
 # ---------------------------------------------------------------------------
 # classify_failure
@@ -180,44 +216,49 @@ class TestClassifyFailure(unittest.TestCase):
 
 
 class TestPrepareWorkspaceModelLayout(unittest.TestCase):
+    # The fallback layout only computes paths and never writes into the
+    # workspace, so one directory can be shared by every test in the class.
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.ws = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
     def test_fallback_path_no_library(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            ws = Path(tmp)
-            layout = prepare_workspace_model_layout(
-                workspace=ws,
-                fallback_model_path=Path("/some/Mutated.mo"),
-                primary_model_name="Mutated",
-            )
-            self.assertIsInstance(layout, WorkspaceModelLayout)
-            self.assertEqual(layout.model_write_path, ws / "Mutated.mo")
-            self.assertEqual(layout.model_identifier, "Mutated")
-            self.assertFalse(layout.uses_external_library)
-            self.assertEqual(len(layout.model_load_files), 1)
-            self.assertEqual(layout.model_load_files[0], "Mutated.mo")
+        layout = prepare_workspace_model_layout(
+            workspace=self.ws,
+            fallback_model_path=Path("/some/Mutated.mo"),
+            primary_model_name="Mutated",
+        )
+        self.assertIsInstance(layout, WorkspaceModelLayout)
+        self.assertEqual(layout.model_write_path, self.ws / "Mutated.mo")
+        self.assertEqual(layout.model_identifier, "Mutated")
+        self.assertFalse(layout.uses_external_library)
+        self.assertEqual(len(layout.model_load_files), 1)
+        self.assertEqual(layout.model_load_files[0], "Mutated.mo")
 
     def test_fallback_path_incomplete_library_args(self):
         # Only package_name provided (not all three), falls through to fallback
-        with tempfile.TemporaryDirectory() as tmp:
-            ws = Path(tmp)
-            layout = prepare_workspace_model_layout(
-                workspace=ws,
-                fallback_model_path=Path("/x/Model.mo"),
-                primary_model_name="Model",
-                source_package_name="Foo",  # missing source_library_path
-            )
-            self.assertFalse(layout.uses_external_library)
-            self.assertEqual(layout.model_identifier, "Model")
+        layout = prepare_workspace_model_layout(
+            workspace=self.ws,
+            fallback_model_path=Path("/x/Model.mo"),
+            primary_model_name="Model",
+            source_package_name="Foo",  # missing source_library_path
+        )
+        self.assertFalse(layout.uses_external_library)
+        self.assertEqual(layout.model_identifier, "Model")
 
     def test_model_load_files_uses_forward_slash(self):
-        with tempfile.TemporaryDirectory() as tmp:
-            ws = Path(tmp)
-            layout = prepare_workspace_model_layout(
-                workspace=ws,
-                fallback_model_path=Path("/x/MyModel.mo"),
-                primary_model_name="MyModel",
-            )
-            for f in layout.model_load_files:
-                self.assertNotIn("\\", f)
+        layout = prepare_workspace_model_layout(
+            workspace=self.ws,
+            fallback_model_path=Path("/x/MyModel.mo"),
+            primary_model_name="MyModel",
+        )
+        for f in layout.model_load_files:
+            self.assertNotIn("\\", f)
 
 
 # ---------------------------------------------------------------------------
@@ -227,14 +268,15 @@ class TestPrepareWorkspaceModelLayout(unittest.TestCase):
 
 class TestCopytreeBestEffort(unittest.TestCase):
     def test_copies_directory(self):
-        with tempfile.TemporaryDirectory() as src_tmp, tempfile.TemporaryDirectory() as dst_tmp:
-            src = Path(src_tmp) / "src"
-            src.mkdir()
-            (src / "file.mo").write_text("model X end X;")
-            dst = Path(dst_tmp) / "dst"
-            result = copytree_best_effort(src, dst)
-            self.assertTrue(result)
-            self.assertTrue((dst / "file.mo").exists())
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        src = root / "src"
+        src.mkdir()
+        (src / "file.mo").write_text("model X end X;")
+        dst = root / "dst"
+        result = copytree_best_effort(src, dst)
+        self.assertTrue(result)
+        self.assertTrue((dst / "file.mo").exists())
 
     def test_returns_false_on_error(self):
         result = copytree_best_effort(Path("/nonexistent/src"), Path("/nonexistent/dst"))
@@ -249,6 +291,7 @@ class TestCopytreeBestEffort(unittest.TestCase):
 class TestCleanupWorkspaceBestEffort(unittest.TestCase):
     def test_removes_directory(self):
         td = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, td, ignore_errors=True)
         Path(td, "file.txt").write_text("hello")
         cleanup_workspace_best_effort(td)
         self.assertFalse(Path(td).exists())
@@ -24,6 +24,36 @@ from gateforge.agent_modelica_workspace_style_probe_v0_67_0 import (
 )
 
 
+_WARNING_PASS_OMC_OUTPUT = (
+    "Check of M completed successfully.\n"
+    "Class M has 1 equation(s) and 1 variable(s).\n"
+    "record SimulationResult\n"
+    '    resultFile = "/workspace/M_res.mat",\n'
+    '    messages = "LOG_ASSERT | warning | assertion failed during initialization: Invalid root\\n'
+    'LOG_SUCCESS | info | The simulation finished successfully."\n'
+    "end SimulationResult;\n"
+)
+
+_MOCK_CASE = {
+    "case_id": "case_a",
+    "model_name": "M",
+    "model_text": "model M\nend M;\n",
+    "workflow_goal": "Fix model",
+}
+
+_SUMMARY_RESULT_ROW = {
+    "case_id": "case_a",
+    "final_verdict": "PASS",
+    "provider_error": "",
+    "harness_timeout": False,
+    "runner_error": "",
+}
+
+
+def _summary_result_row(**overrides) -> dict:
+    return {**_SUMMARY_RESULT_ROW, "candidate_files": [], **overrides}
+
+
 class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
     def test_tool_count_is_eight(self) -> None:
         self.assertEqual(len(WORKSPACE_TOOL_DEFS), 8)
@@ -364,17 +394,7 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
         profile = RUN_PROFILES[LONG_RUN_900S_PROFILE]
         summary = _build_summary(
             tasks=[{"case_id": "case_a"}],
-            results=[
-                {
-                    "case_id": "case_a",
-                    "final_verdict": "PASS",
-                    "provider_error": "",
-                    "harness_timeout": False,
-                    "runner_error": "",
-                    "submission_mode": "llm",
-                    "candidate_files": [],
-                }
-            ],
+            results=[_summary_result_row(submission_mode="llm")],
             run_profile=LONG_RUN_900S_PROFILE,
             max_steps=profile["max_steps"],
             max_token_budget=profile["max_token_budget"],
@@ -389,18 +409,7 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
     def test_summary_blocks_checkpoint_contaminated_results(self) -> None:
         summary = _build_summary(
             tasks=[{"case_id": "case_a"}],
-            results=[
-                {
-                    "case_id": "case_a",
-                    "final_verdict": "PASS",
-                    "provider_error": "",
-                    "harness_timeout": False,
-                    "runner_error": "",
-                    "submit_checkpoint_triggered": True,
-                    "submission_mode": "checkpoint",
-                    "candidate_files": [],
-                }
-            ],
+            results=[_summary_result_row(submit_checkpoint_triggered=True, submission_mode="checkpoint")],
         )
         self.assertFalse(summary["conclusion_allowed"])
         self.assertEqual(summary["submit_checkpoint_count"], 1)
@@ -417,17 +426,7 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
     def test_summary_reports_invalid_submission_attempts(self) -> None:
         summary = _build_summary(
             tasks=[{"case_id": "case_a"}],
-            results=[
-                {
-                    "case_id": "case_a",
-                    "final_verdict": "FAILED",
-                    "provider_error": "",
-                    "harness_timeout": False,
-                    "runner_error": "",
-                    "invalid_submission_attempt_count": 2,
-                    "candidate_files": [],
-                }
-            ],
+            results=[_summary_result_row(final_verdict="FAILED", invalid_submission_attempt_count=2)],
         )
         self.assertEqual(summary["invalid_submission_attempt_count"], 2)
         self.assertTrue(summary["conclusion_allowed"])
@@ -435,18 +434,7 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
     def test_summary_records_over_token_budget_results_without_blocking_conclusion(self) -> None:
         summary = _build_summary(
             tasks=[{"case_id": "case_a"}],
-            results=[
-                {
-                    "case_id": "case_a",
-                    "final_verdict": "PASS",
-                    "provider_error": "",
-                    "harness_timeout": False,
-                    "runner_error": "",
-                    "submission_mode": "llm",
-                    "candidate_files": [],
-                    "token_used": 65,
-                }
-            ],
+            results=[_summary_result_row(submission_mode="llm", token_used=65)],
             max_token_budget=64,
         )
 
@@ -504,18 +492,9 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
             workspace = Path(td)
             candidate_paths = {}
             candidate_meta = {}
-            warning_output = (
-                "Check of M completed successfully.\n"
-                "Class M has 1 equation(s) and 1 variable(s).\n"
-                "record SimulationResult\n"
-                '    resultFile = "/workspace/M_res.mat",\n'
-                '    messages = "LOG_ASSERT | warning | assertion failed during initialization: Invalid root\\n'
-                'LOG_SUCCESS | info | The simulation finished successfully."\n'
-                "end SimulationResult;\n"
-            )
             with patch(
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0._run_omc_check",
-                return_value=(warning_output, True, False),
+                return_value=(_WARNING_PASS_OMC_OUTPUT, True, False),
             ):
                 single = json.loads(_dispatch_workspace_tool(
                     name="write_and_check_candidate_model",
@@ -558,21 +537,6 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                     "",
                 )
 
-        warning_output = (
-            "Check of M completed successfully.\n"
-            "Class M has 1 equation(s) and 1 variable(s).\n"
-            "record SimulationResult\n"
-            '    resultFile = "/workspace/M_res.mat",\n'
-            '    messages = "LOG_ASSERT | warning | assertion failed during initialization: Invalid root\\n'
-            'LOG_SUCCESS | info | The simulation finished successfully."\n'
-            "end SimulationResult;\n"
-        )
-        case = {
-            "case_id": "case_a",
-            "model_name": "M",
-            "model_text": "model M\nend M;\n",
-            "workflow_goal": "Fix model",
-        }
         config = LLMProviderConfig(provider_name="mock", model="mock", api_key="mock")
         with tempfile.TemporaryDirectory() as td:
             with patch(
@@ -580,12 +544,12 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                 return_value=(FakeAdapter(), config),
             ), patch(
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0._run_omc_check",
-                return_value=(warning_output, True, False),
+                return_value=(_WARNING_PASS_OMC_OUTPUT, True, False),
             ), patch(
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0._run_omc_simulate",
-                return_value=(warning_output, True, False),
+                return_value=(_WARNING_PASS_OMC_OUTPUT, True, False),
             ):
-                result = run_workspace_style_case(case, out_dir=Path(td), max_steps=1)
+                result = run_workspace_style_case(dict(_MOCK_CASE), out_dir=Path(td), max_steps=1)
 
         self.assertTrue(result["submitted"])
         self.assertEqual(result["submitted_candidate_id"], "c1")
@@ -612,19 +576,13 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                 )
 
         adapter = FakeAdapter()
-        case = {
-            "case_id": "case_a",
-            "model_name": "M",
-            "model_text": "model M\nend M;\n",
-            "workflow_goal": "Fix model",
-        }
         config = LLMProviderConfig(provider_name="mock", model="mock", api_key="mock")
         with tempfile.TemporaryDirectory() as td:
             with patch(
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0.resolve_provider_adapter",
                 return_value=(adapter, config),
             ):
-                run_workspace_style_case(case, out_dir=Path(td), max_steps=4, max_token_budget=20)
+                run_workspace_style_case(dict(_MOCK_CASE), out_dir=Path(td), max_steps=4, max_token_budget=20)
 
         visible_text = "\n".join(
             str(message.get("content") or "")
@@ -648,12 +606,6 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                     "",
                 )
 
-        case = {
-            "case_id": "case_a",
-            "model_name": "M",
-            "model_text": "model M\nend M;\n",
-            "workflow_goal": "Fix model",
-        }
         config = LLMProviderConfig(provider_name="mock", model="mock", api_key="mock")
         with tempfile.TemporaryDirectory() as td:
             out_dir = Path(td)
@@ -664,7 +616,7 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0.resolve_provider_adapter",
                 return_value=(FakeAdapter(), config),
             ):
-                run_workspace_style_case(case, out_dir=out_dir, max_steps=1, max_token_budget=20)
+                run_workspace_style_case(dict(_MOCK_CASE), out_dir=out_dir, max_steps=1, max_token_budget=20)
 
             self.assertFalse(stale.exists())
             self.assertTrue((out_dir / "workspaces" / "case_a" / "initial.mo").exists())
@@ -754,19 +706,13 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                     "",
                 )
 
-        case = {
-            "case_id": "case_a",
-            "model_name": "M",
-            "model_text": "model M\nend M;\n",
-            "workflow_goal": "Fix model",
-        }
         config = LLMProviderConfig(provider_name="mock", model="mock", api_key="mock")
         with tempfile.TemporaryDirectory() as td:
             with patch(
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0.resolve_provider_adapter",
                 return_value=(FakeAdapter(), config),
             ):
-                result = run_workspace_style_case(case, out_dir=Path(td), max_steps=1)
+                result = run_workspace_style_case(dict(_MOCK_CASE), out_dir=Path(td), max_steps=1)
 
         self.assertFalse(result["submitted"])
         self.assertEqual(result["submission_mode"], "none")
@@ -809,12 +755,6 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                     "",
                 )
 
-        case = {
-            "case_id": "case_a",
-            "model_name": "M",
-            "model_text": "model M\nend M;\n",
-            "workflow_goal": "Fix model",
-        }
         config = LLMProviderConfig(provider_name="mock", model="mock", api_key="mock")
         with tempfile.TemporaryDirectory() as td:
             with patch(
@@ -827,7 +767,7 @@ class AgentModelicaWorkspaceStyleProbeV067Tests(unittest.TestCase):
                 "gateforge.agent_modelica_workspace_style_probe_v0_67_0._run_omc_simulate",
                 return_value=("record SimulationResult\nThe simulation finished successfully.", False, True),
             ):
-                result = run_workspace_style_case(case, out_dir=Path(td), max_steps=2)
+                result = run_workspace_style_case(dict(_MOCK_CASE), out_dir=Path(td), max_steps=2)
 
         self.assertTrue(result["submitted"])
         self.assertEqual(result["final_verdict"], "FAILED")
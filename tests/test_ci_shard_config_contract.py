@@ -13,6 +13,8 @@ class CIShardConfigContractTests(unittest.TestCase):
         self.assertIn("python -m unittest", workflow)
         self.assertIn("tests.test_agent_modelica_workspace_style_probe_v0_67", workflow)
         self.assertIn("tests.test_agent_modelica_omc_workspace_v1", workflow)
+        self.assertIn("tests.test_evaluation_overlay", workflow)
+        self.assertIn("tests.test_external_failure_taxonomy", workflow)
         self.assertIn("task_[0-9]{3,}", workflow)
         self.assertNotIn("v0.138", workflow)
         self.assertNotIn("v0.139", workflow)
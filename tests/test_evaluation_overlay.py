@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import contextlib
+import io
+import json
+import tempfile
 import unittest
+from pathlib import Path
 
-from scripts.build_evaluation_overlay import build_overlay, load_replacements
+from scripts.build_evaluation_overlay import build_overlay, load_replacements, main
 
 
 class EvaluationOverlayTests(unittest.TestCase):
@@ -32,10 +37,6 @@ class EvaluationOverlayTests(unittest.TestCase):
         self.assertEqual(summary["status"], "REVIEW")
 
     def test_load_replacements_ignores_failed_rows(self) -> None:
-        import tempfile
-        from pathlib import Path
-        import json
-
         with tempfile.TemporaryDirectory() as td:
             path = Path(td) / "rows.jsonl"
             path.write_text(
@@ -48,6 +49,37 @@ class EvaluationOverlayTests(unittest.TestCase):
 
         self.assertEqual(sorted(replacements), ["case_a"])
 
+    def test_main_runs_in_process_and_writes_outputs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            base = root / "base.jsonl"
+            base.write_text(
+                json.dumps({"case_id": "case_a", "subject_status": "fail", "baseline_status": "pass"}) + "\n",
+                encoding="utf-8",
+            )
+            replacement = root / "replacement.jsonl"
+            replacement.write_text(json.dumps({"case_id": "case_a", "status": "pass"}) + "\n", encoding="utf-8")
+            out_dir = root / "out"
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                rc = main(
+                    [
+                        "--base-results",
+                        str(base),
+                        "--replacement-results",
+                        str(replacement),
+                        "--out-dir",
+                        str(out_dir),
+                    ]
+                )
+            summary = json.loads((out_dir / "summary.json").read_text(encoding="utf-8"))
+            adjusted_exists = (out_dir / "adjusted_results.jsonl").exists()
+
+        self.assertEqual(rc, 0)
+        self.assertTrue(adjusted_exists)
+        self.assertEqual(summary["applied_replacement_case_ids"], ["case_a"])
+        self.assertEqual(json.loads(stdout.getvalue()), summary)
+
 
 if __name__ == "__main__":
     unittest.main()
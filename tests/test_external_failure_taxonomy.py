@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import contextlib
+import io
+import json
 import tempfile
 import unittest
 from pathlib import Path
 
-from scripts.build_external_failure_taxonomy import build_taxonomy, failure_stage
+from scripts.build_external_failure_taxonomy import build_taxonomy, failure_stage, main
 
 
 class ExternalFailureTaxonomyTests(unittest.TestCase):
     def test_failure_stage_detects_common_modelica_failures(self) -> None:
-        self.assertEqual(failure_stage("Error: Too few equations."), "model_check_underdetermined")
-        self.assertEqual(failure_stage("messages = \"Simulation execution failed\""), "simulate")
-        self.assertEqual(failure_stage("Failed to build model: Demo"), "build_or_model_check")
+        cases = [
+            ("Error: Too few equations.", "model_check_underdetermined"),
+            ("Error: Too many equations, over-determined system.", "model_check_overdetermined"),
+            ("messages = \"Simulation execution failed\"", "simulate"),
+            ("Failed to build model: Demo", "build_or_model_check"),
+            ("", "unknown"),
+        ]
+        for log_text, expected in cases:
+            with self.subTest(expected=expected):
+                self.assertEqual(failure_stage(log_text), expected)
 
     def test_build_taxonomy_classifies_external_failures(self) -> None:
         pairwise_rows = [
@@ -62,6 +72,39 @@ class ExternalFailureTaxonomyTests(unittest.TestCase):
         self.assertEqual(rows[1]["taxonomy"], "shared_failure")
         self.assertEqual(summary["shared_failure_case_ids"], ["case_b"])
 
+    def test_main_runs_in_process_and_writes_outputs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            pairwise = root / "pairwise.jsonl"
+            pairwise.write_text(
+                json.dumps({"case_id": "case_a", "subject_status": "pass", "external_status": "fail"}) + "\n",
+                encoding="utf-8",
+            )
+            external = root / "external.jsonl"
+            external.write_text(json.dumps({"case_id": "case_a", "timed_out": True}) + "\n", encoding="utf-8")
+            out_dir = root / "out"
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                rc = main(
+                    [
+                        "--pairwise-results",
+                        str(pairwise),
+                        "--external-results",
+                        str(external),
+                        "--workspace-root",
+                        str(root / "workspaces"),
+                        "--out-dir",
+                        str(out_dir),
+                    ]
+                )
+            summary = json.loads((out_dir / "summary.json").read_text(encoding="utf-8"))
+            rows = json.loads((out_dir / "case_taxonomy.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(rc, 0)
+        self.assertEqual(summary["taxonomy_counts"], {"no_final_timeout": 1})
+        self.assertEqual(rows[0]["case_id"], "case_a")
+        self.assertEqual(json.loads(stdout.getvalue()), summary)
+
 
 if __name__ == "__main__":
     unittest.main()
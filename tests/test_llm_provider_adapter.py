@@ -16,27 +16,22 @@ from gateforge.llm_provider_adapter import (
 
 
 class LLMProviderAdapterTests(unittest.TestCase):
-    def test_resolve_provider_adapter_detects_openai(self) -> None:
-        with mock.patch("gateforge.llm_provider_adapter._bootstrap_env_from_repo", return_value=0), mock.patch.dict(
-            os.environ,
-            {"OPENAI_API_KEY": "sk-test", "LLM_MODEL": "gpt-5-mini"},
-            clear=True,
-        ):
-            adapter, config = resolve_provider_adapter("")
-        self.assertEqual(adapter.provider_name, "openai")
-        self.assertEqual(config.provider_name, "openai")
-        self.assertEqual(config.api_key, "sk-test")
-
-    def test_resolve_provider_adapter_detects_anthropic(self) -> None:
-        with mock.patch("gateforge.llm_provider_adapter._bootstrap_env_from_repo", return_value=0), mock.patch.dict(
-            os.environ,
-            {"ANTHROPIC_API_KEY": "anth-test", "LLM_MODEL": "claude-sonnet-4-5"},
-            clear=True,
-        ):
-            adapter, config = resolve_provider_adapter("")
-        self.assertEqual(adapter.provider_name, "anthropic")
-        self.assertEqual(config.provider_name, "anthropic")
-        self.assertEqual(config.api_key, "anth-test")
+    def test_resolve_provider_adapter_infers_provider_from_model_name(self) -> None:
+        # No LLM_PROVIDER in any row: the model name picks the provider, then its key env is read.
+        cases = [
+            ("openai", {"OPENAI_API_KEY": "sk-test", "LLM_MODEL": "gpt-5-mini"}, "sk-test"),
+            ("anthropic", {"ANTHROPIC_API_KEY": "anth-test", "LLM_MODEL": "claude-sonnet-4-5"}, "anth-test"),
+            ("deepseek", {"DEEPSEEK_API_KEY": "deepseek-test", "LLM_MODEL": "deepseek-v4-flash"}, "deepseek-test"),
+        ]
+        for provider, env, api_key in cases:
+            with self.subTest(provider=provider):
+                with mock.patch(
+                    "gateforge.llm_provider_adapter._bootstrap_env_from_repo", return_value=0
+                ), mock.patch.dict(os.environ, env, clear=True):
+                    adapter, config = resolve_provider_adapter("")
+                self.assertEqual(adapter.provider_name, provider)
+                self.assertEqual(config.provider_name, provider)
+                self.assertEqual(config.api_key, api_key)
 
     def test_resolve_provider_adapter_detects_minimax(self) -> None:
         with mock.patch("gateforge.llm_provider_adapter._bootstrap_env_from_repo", return_value=0), mock.patch.dict(
@@ -104,20 +99,6 @@ class LLMProviderAdapterTests(unittest.TestCase):
         self.assertEqual(config.extra.get("deepseek_base_url"), "")
         self.assertEqual(config.extra.get("max_tokens"), 8192)
 
-    def test_resolve_provider_adapter_infers_deepseek_from_model_name(self) -> None:
-        with mock.patch("gateforge.llm_provider_adapter._bootstrap_env_from_repo", return_value=0), mock.patch.dict(
-            os.environ,
-            {
-                "DEEPSEEK_API_KEY": "deepseek-test",
-                "LLM_MODEL": "deepseek-v4-flash",
-            },
-            clear=True,
-        ):
-            adapter, config = resolve_provider_adapter("")
-        self.assertEqual(adapter.provider_name, "deepseek")
-        self.assertEqual(config.provider_name, "deepseek")
-        self.assertEqual(config.api_key, "deepseek-test")
-
     def test_resolve_provider_adapter_detects_kimi_code_env(self) -> None:
         with mock.patch("gateforge.llm_provider_adapter._bootstrap_env_from_repo", return_value=0), mock.patch.dict(
             os.environ,